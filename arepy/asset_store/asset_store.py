@@ -40,6 +40,19 @@ class AssetStore:
 
         self.textures[name] = renderer.create_texture(path=Path(path))
 
+    def load_textures(
+        self,
+        renderer: Renderer2D,
+        paths: Dict[str, str],
+    ) -> None:
+        """Load several textures at once, decoding the image files in parallel."""
+        for path in paths.values():
+            if not exists(path):
+                raise FileNotFoundError(f"Texture file not found: {path}")
+
+        textures = renderer.create_textures([Path(path) for path in paths.values()])
+        self.textures.update(zip(paths.keys(), textures))
+
     def load_font(self, name: str, path: str, size: int) -> None: ...
     def get_texture(self, name: str) -> ArepyTexture:
         return self.textures[name]
@@ -1,9 +1,11 @@
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, Type
 
 from .ecs.components import Component
 from .ecs.registry import Entity, Registry
 
 
+@dataclass(slots=True, init=False, eq=False)
 class EntityBuilder:
     """A builder for entities.
 
@@ -11,12 +13,15 @@ class EntityBuilder:
     It allows for the creation of entities with components without having to touch the ecs registry.
     """
 
-    _registry: Registry
+    _entity: Entity
+    _registry: Registry = field(repr=False)
+    # keyed by component type, so duplicate checks are a single lookup
+    _components: Dict[Type[Component], Component] = field(init=False)
 
     def __init__(self, entity: Entity, registry: Registry):
         self._entity = entity
-        self._components: List[Component] = list()
         self._registry = registry
+        self._components = dict()
 
     def with_component(self, component: Component) -> "EntityBuilder":
         """Add a component to the entity.
@@ -29,22 +34,15 @@ class EntityBuilder:
                 f"Component must be of type Component, not {type(component)}."
             )
 
-        for _component in self._components:
-            if type(_component) == type(component):
-                raise TypeError(
-                    f"Component {type(component)} already exists in entity."
-                )
+        component_type = type(component)
+        if component_type in self._components:
+            raise TypeError(f"Component {component_type} already exists in entity.")
 
-        self._components.append(component)
+        self._components[component_type] = component
         return self
 
     def build(self) -> Entity:
         """Build the entity with the components, the components are built and added to the registry."""
-        for component in self._components:
-            self._registry.add_component(
-                self._entity,
-                type(component),
-                component,
-            )
+        self._registry.add_components(self._entity, self._components)
 
         return self._entity
@@ -4,6 +4,8 @@ from ...math.vec3 import Vec3
 
 
 class Camera2D(Component):
+    __slots__ = ("target", "position", "zoom")
+
     def __init__(self, target: Vec2, position: Vec2, zoom: float = 1.0) -> None:
         self.target = target
         self.position = position
@@ -11,6 +13,8 @@ class Camera2D(Component):
 
 
 class Camera3D(Component):
+    __slots__ = ("target", "position", "zoom")
+
     def __init__(self, target: Vec3, position: Vec3, zoom: float = 1.0) -> None:
         self.target = target
         self.position = position
@@ -1,10 +1,16 @@
+from typing import Optional
+
 from ...ecs.components import Component
 from ...math.vec2 import Vec2
 
 
 class RigidBody2D(Component):
+    __slots__ = ("velocity", "acceleration")
+
     def __init__(
-        self, velocity: Vec2 = Vec2(0, 0), acceleration: Vec2 = Vec2(0, 0)
+        self, velocity: Optional[Vec2] = None, acceleration: Optional[Vec2] = None
     ) -> None:
-        self.velocity = velocity
-        self.acceleration = acceleration
+        self.velocity = Vec2(*velocity) if velocity is not None else Vec2(0, 0)
+        self.acceleration = (
+            Vec2(*acceleration) if acceleration is not None else Vec2(0, 0)
+        )
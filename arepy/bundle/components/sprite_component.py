@@ -2,6 +2,8 @@ from ...ecs import Component
 
 
 class Sprite(Component):
+    __slots__ = ("asset_id", "src_rect", "z_index")
+
     def __init__(
         self,
         asset_id: str,
@@ -1,14 +1,19 @@
+from typing import Optional
+
 from ...ecs import Component
 from ...math.vec2 import Vec2
 
 
 class Transform(Component):
+    __slots__ = ("position", "scale", "rotation")
+
     def __init__(
         self,
-        position: Vec2 = Vec2(0, 0),
-        scale: Vec2 = Vec2(1, 1),
+        position: Optional[Vec2] = None,
+        scale: Optional[Vec2] = None,
         rotation: float = 0,
     ):
-        self.position = position
-        self.scale = scale
+        # copy: systems update these vectors in place, callers keep their own
+        self.position = Vec2(*position) if position is not None else Vec2(0, 0)
+        self.scale = Vec2(*scale) if scale is not None else Vec2(1, 1)
         self.rotation = rotation
@@ -2,6 +2,7 @@ from arepy.asset_store import AssetStore
 from arepy.bundle.components import Sprite, Transform
 from arepy.ecs.query import Query, With
 from arepy.ecs.registry import Entity
+from arepy.engine.renderer import ArepyTexture
 from arepy.engine.renderer.renderer_2d import Color, Rect, Renderer2D
 
 COLORS = [
@@ -15,36 +16,48 @@ COLORS = [
     Color(0, 0, 0, 255),  # black
 ]
 
+WHITE = Color(255, 255, 255, 255)
+
+
+def _draw_order(item: tuple[tuple[Transform, Sprite], Entity]) -> tuple[int, str, int]:
+    (_, sprite), entity = item
+    # the entity id breaks ties, the query's entity order changes on removals
+    return (sprite.z_index, sprite.asset_id, entity.get_id())
+
 
 def render_system(
     query: Query[Entity, With[Transform, Sprite]],
     renderer: Renderer2D,
     asset_store: AssetStore,
 ):
+    # the engine already clears the frame before running the RENDER pipeline
     renderer.start_frame()
-    renderer.clear(color=Color(245, 245, 245, 255))
-    for entity in query.get_entities():
-        position = entity.get_component(Transform).position
-        sprite = entity.get_component(Sprite)
-        texture = asset_store.get_texture(sprite.asset_id)
-        texture_size = texture.get_size()
-        dst_rect = Rect(
-            position.x,
-            position.y,
-            int(texture_size[0]),
-            int(texture_size[1]),
-        )
-        src_rect = Rect(
-            float(sprite.src_rect[0]),
-            float(sprite.src_rect[1]),
-            int(sprite.src_rect[2]),
-            int(sprite.src_rect[3]),
-        )
+    # raylib batches consecutive quads that share a texture into a single draw
+    # call, so drawing by layer and then by texture keeps those runs together.
+    components = sorted(
+        zip(query.get_components(Transform, Sprite), query.get_entities()),
+        key=_draw_order,
+    )
+    # the renderer consumes the rects immediately, so reuse them for every sprite
+    src_rect = Rect(0, 0, 0, 0)
+    dst_rect = Rect(0, 0, 0, 0)
+    # many sprites share a texture, resolve each asset only once per frame
+    textures: dict[str, tuple[ArepyTexture, tuple[int, int]]] = {}
+    for (transform, sprite), _ in components:
+        position = transform.position
+        cached_texture = textures.get(sprite.asset_id)
+        if cached_texture is None:
+            texture = asset_store.get_texture(sprite.asset_id)
+            cached_texture = textures[sprite.asset_id] = (texture, texture.get_size())
+        texture, (dst_rect.width, dst_rect.height) = cached_texture
+        dst_rect.x = position.x
+        dst_rect.y = position.y
+        src_rect.x, src_rect.y, src_rect.width, src_rect.height = sprite.src_rect
         renderer.draw_texture(
             texture,
             src_rect,
             dst_rect,
-            Color(255, 255, 255, 255),
+            WHITE,
         )
     renderer.draw_fps((10, 10))
     renderer.end_frame()
@@ -8,6 +8,7 @@ from typing import (
     Protocol,
     Type,
     TypeVar,
+    Union,
 )
 
 
@@ -18,7 +19,23 @@ class ComponentIndex:
     __last_insert: Optional[str] = None
 
     @classmethod
-    def get_id(cls, class_name: str) -> int:
+    def get_id(cls, component: Union[str, type]) -> int:
+        """Return the id for a component class or class name.
+
+        Passing the class is the fast path: the id is cached on the class itself,
+        so later lookups are a single attribute read instead of a string hash.
+        """
+        if isinstance(component, str):
+            return cls.__get_id_by_name(component)
+        # read the class __dict__ so a subclass never inherits its parent's id
+        component_id = component.__dict__.get("__arepy_component_id__")
+        if component_id is None:
+            component_id = cls.__get_id_by_name(component.__name__)
+            setattr(component, "__arepy_component_id__", component_id)
+        return component_id
+
+    @classmethod
+    def __get_id_by_name(cls, class_name: str) -> int:
         internal_class_name = f"{class_name}_{id(cls)}"
         if not internal_class_name in cls.__id_counters:
             counter = 0
@@ -35,13 +52,16 @@ class Component:
     Components are used to store data that is relevant to an entity.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        class_name = type(self).__name__
-        self.id = ComponentIndex.get_id(class_name)
+        # nothing to set per instance: the id lives on the component class,
+        # so subclasses don't need to call super().__init__()
+        ...
 
     def get_id(self) -> int:
         """Return the unique id of the component."""
-        return self.id
+        return ComponentIndex.get_id(type(self))
 
 
 TComponent = TypeVar("TComponent", bound=Component)
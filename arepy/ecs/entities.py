@@ -11,12 +11,11 @@ Entities = NewType("Entities", Set["Entity"])
 
 
 class Entity:
-    __slots__ = ["_id", "_registry", "_component_cache"]
+    __slots__ = ["_id", "_registry"]
 
     def __init__(self, id: int, registry: "Registry"):
         self._id = id
         self._registry = registry
-        self._component_cache = {}
 
     def get_id(self) -> int:
         return self._id
@@ -25,14 +24,11 @@ class Entity:
         if self._registry is None:
             raise RegistryNotSetError
 
-        if component := self._component_cache.get(component_type):
-            return component
-
+        # the registry pools are indexed by entity id, no per-entity cache needed
         component = self._registry.get_component(self, component_type)
         if component is None:
             raise ComponentNotFoundError(component_type)
 
-        self._component_cache[component_type] = component
         return component
 
     def remove_component(self, component_type: Type[TComponent]) -> None:
@@ -40,9 +36,6 @@ class Entity:
             raise RegistryNotSetError
         self._registry.remove_component(self, component_type)
 
-        if component_type in self._component_cache:
-            del self._component_cache[component_type]
-
     def has_component(self, component_type: Type[TComponent]) -> bool:
         if self._registry is None:
             raise RegistryNotSetError
@@ -51,7 +44,6 @@ class Entity:
     def kill(self) -> None:
         if self._registry is None:
             raise RegistryNotSetError
-        self._component_cache.clear()
         self._registry.kill_entity(self)
 
     def __repr__(self) -> str:
@@ -66,4 +58,5 @@ class Entity:
         return self._id == other._id
 
     def __hash__(self) -> int:
-        return hash(self._id)
+        # ids are small positive ints, which already hash to themselves
+        return self._id
@@ -1,4 +1,5 @@
 from typing import Type
+from weakref import WeakKeyDictionary
 
 from .components import TComponent
 
@@ -14,8 +15,18 @@ class MaximumComponentsExceededError(Exception):
         super().__init__(f"Maximum number of components ({max_components}) exceeded.")
 
 
+# one prebuilt message per component type, raising only does a dict lookup;
+# weak keys so the cache never keeps a discarded component class alive
+_component_not_found_messages: "WeakKeyDictionary[type, str]" = WeakKeyDictionary()
+
+
 class ComponentNotFoundError(Exception):
     """Raised when a component is not found."""
 
     def __init__(self, component_type: Type[TComponent]) -> None:
-        super().__init__(f"Component {component_type} does not exist.")
+        message = _component_not_found_messages.get(component_type)
+        if message is None:
+            message = f"Component {component_type} does not exist."
+            _component_not_found_messages[component_type] = message
+        super().__init__(message)
+        self.component_type = component_type
@@ -1,9 +1,11 @@
 from collections import OrderedDict
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -13,18 +15,18 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    get_type_hints,
 )
-
-from arepy.ecs.threading import ECS_LOCK
+from weakref import WeakKeyDictionary
 
 from ..components import Component, ComponentIndex
 from ..constants import MAX_COMPONENTS
+from ..exceptions import RegistryNotSetError
 from ..utils import Signature
 
-try:
-    from .. import Entity
-except ImportError:
-    ...
+if TYPE_CHECKING:
+    from ..entities import Entity
+    from ..registry import Registry
 
 TEntity = TypeVar("TEntity")
 TFilter = TypeVar("TFilter")
@@ -63,13 +65,26 @@ class Query(Generic[TEntity, TFilter]):
         and the threads will process every entity(in chunks) instead of processing a loop of entities.
     """
 
-    __slots__ = ["_signature", "_entities", "_kind", "_thread_id"]
+    __slots__ = [
+        "_signature",
+        "_without_mask",
+        "_entities",
+        "_entity_slots",
+        "_kind",
+        "_thread_id",
+        "_registry",
+    ]
 
     def __init__(self) -> None:
         self._signature = Signature(MAX_COMPONENTS)
-        self._entities: set["Entity"] = set()
+        # components a matching entity must not have (`Without[...]`)
+        self._without_mask = 0
+        # dense list of matched entities + entity id -> index in that list
+        self._entities: List["Entity"] = []
+        self._entity_slots: dict[int, int] = {}
         self._kind: Union[With, Without] = None  # type: ignore
         self._thread_id: Optional[int] = None
+        self._registry: Optional["Registry"] = None
 
     def get_component_signature(self) -> Signature:
         if self._kind is With and not self._signature.was_flipped:
@@ -77,14 +92,65 @@ class Query(Generic[TEntity, TFilter]):
 
         return self._signature
 
-    def get_entities(self) -> set["Entity"]:
+    def matches(self, signature: Signature) -> bool:
+        """Whether an entity with this component signature belongs to the query."""
+        bits = signature.get_bits()
+        with_mask = self.get_component_signature().get_bits()
+        return bits & with_mask == with_mask and not bits & self._without_mask
+
+    def get_entities(self) -> List["Entity"]:
         return self._entities
 
+    def get_components(self, *component_types: Type[Component]) -> Iterator[tuple]:
+        """Iterate over the components of the matched entities, one tuple per entity.
+
+        The component pools are resolved once per call instead of once per entity,
+        so prefer this over `entity.get_component` in hot loops. The requested
+        components should be part of the query's `With[...]` filter.
+
+        Example:
+        ```python
+        for transform, velocity in query.get_components(Transform, RigidBody2D):
+            transform.position.x += velocity.velocity.x
+        ```
+        """
+        if self._registry is None:
+            raise RegistryNotSetError
+        pools = [
+            self._registry.get_component_pool(component_type)
+            for component_type in component_types
+        ]
+        # unrolled paths for the common shapes: no inner loop or list per entity
+        if len(pools) == 1:
+            (first,) = pools
+            for entity in self._entities:
+                yield (first[entity.get_id() - 1],)  # type: ignore
+        elif len(pools) == 2:
+            first, second = pools
+            for entity in self._entities:
+                index = entity.get_id() - 1
+                yield first[index], second[index]  # type: ignore
+        else:
+            for entity in self._entities:
+                index = entity.get_id() - 1
+                yield tuple([pool[index] for pool in pools])  # type: ignore
+
     def add_entity(self, entity: "Entity") -> None:
-        self._entities.add(entity)
+        entity_id = entity.get_id()
+        if entity_id in self._entity_slots:
+            return
+        self._entity_slots[entity_id] = len(self._entities)
+        self._entities.append(entity)
 
     def remove_entity(self, entity: "Entity") -> None:
-        self._entities.remove(entity)
+        # swap-remove: move the last entity into the freed slot to stay dense
+        slot = self._entity_slots.pop(entity.get_id(), None)
+        if slot is None:
+            return
+        last_entity = self._entities.pop()
+        if slot != len(self._entities):
+            self._entities[slot] = last_entity
+            self._entity_slots[last_entity.get_id()] = slot
 
     def __iter__(self) -> Iterable["Entity"]:
         return iter(self._entities)
@@ -95,45 +161,90 @@ class Query(Generic[TEntity, TFilter]):
 def get_signed_query_arguments(function: Callable) -> OrderedDict[str, Any]:
     """Sign the query with the components that the function needs and return the arguments in order.
 
+    The annotations are parsed once per function; later calls only build fresh
+    `Query` instances from the cached specs.
+
     note: in Python 3.14 we can use the new feature of the annotations module to get the annotations of a function.
     @see: https://docs.python.org/3.14/library/annotationlib.html
     """
 
-    func_arguments = get_annotations(function)
-    queries_signature = get_queries_from_arguments(func_arguments)
+    cached = _query_specs_cache.get(function)
+    if cached is None:
+        annotations = get_annotations(function)
+        query_specs = get_query_specs(get_queries_from_arguments(annotations))
+        cached = _query_specs_cache[function] = (annotations, query_specs)
 
-    if not queries_signature:
+    annotations, query_specs = cached
+    func_arguments = OrderedDict(annotations)
+    if not query_specs:
         return func_arguments
 
-    signed_queries = sign_queries(queries_signature)
-    func_arguments.update(signed_queries)
+    func_arguments.update(build_queries(query_specs))
     return func_arguments
 
 
 QuerySignature = list[tuple[str, Callable[[], Query]]]
+# (argument name, query factory, With/Without filter, with mask, without mask)
+QuerySpec = tuple[str, Callable[[], Query], Any, int, int]
+
+SignedArguments = tuple[OrderedDict[str, Any], list[QuerySpec]]
+
+# weak keys: a signed system function (often a closure) is not kept alive by the cache
+_query_specs_cache: WeakKeyDictionary[Callable, SignedArguments] = WeakKeyDictionary()
 
 
 def sign_queries(
     queries_signature: QuerySignature,
 ) -> List[tuple[str, Query]]:
-    signed_queries = []
+    return build_queries(get_query_specs(queries_signature))
+
+
+def get_query_specs(queries_signature: QuerySignature) -> List[QuerySpec]:
+    """Resolve the filter and the component masks of each query annotation."""
+    query_specs = []
     for name, query_signature in queries_signature:
         query_factory: Callable[[], Query] = cast(Callable[[], Query], query_signature)
         kind_of_result = query_factory.__args__[1]
         required_components: tuple[Type[Component], ...] = kind_of_result.__args__[0]
+        components_mask = 0
+        for component_type in required_components:
+            components_mask |= 1 << ComponentIndex.get_id(component_type)
+        if getattr(kind_of_result, "__origin__", kind_of_result) is Without:
+            query_specs.append(
+                (name, query_factory, kind_of_result, 0, components_mask)
+            )
+        else:
+            query_specs.append(
+                (name, query_factory, kind_of_result, components_mask, 0)
+            )
+
+    return query_specs
+
+
+def build_queries(query_specs: List[QuerySpec]) -> List[tuple[str, Query]]:
+    """Create a new signed query for each spec."""
+    signed_queries = []
+    for name, query_factory, kind_of_result, with_mask, without_mask in query_specs:
         query: Query = query_factory()
         query._kind = kind_of_result
-        for component_type in required_components:
-            component_id = ComponentIndex.get_id(component_type.__name__)
-            query._signature.set(component_id, True)
+        query._signature.set_bits(with_mask)
+        query._without_mask = without_mask
         signed_queries.append((name, query))
 
     return signed_queries
 
 
 def get_annotations(function: Callable) -> OrderedDict[str, Any]:
-    """Get the annotations of a function in order"""
-    return OrderedDict(function.__annotations__)
+    """Get the annotations of a function in order
+
+    String annotations (`from __future__ import annotations`) are resolved with
+    `typing.get_type_hints`, which evaluates them; plain annotations are read as is.
+    Callers cache the result per function, see `get_signed_query_arguments`.
+    """
+    annotations = function.__annotations__
+    if any(isinstance(value, str) for value in annotations.values()):
+        return OrderedDict(get_type_hints(function))
+    return OrderedDict(annotations)
 
 
 def get_queries_from_arguments(
@@ -1,16 +1,26 @@
 import logging
 from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from inspect import isclass, isfunction
-from typing import Dict, List, Optional, Sequence, Set, Type, cast
-
-from .components import ComponentIndex, ComponentPool, IComponentPool, TComponent
+from inspect import isclass, iscoroutinefunction, isfunction
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Type, cast
+
+from .components import (
+    Component,
+    ComponentIndex,
+    ComponentPool,
+    IComponentPool,
+    TComponent,
+)
 from .constants import MAX_COMPONENTS
 from .entities import Entity
 from .exceptions import MaximumComponentsExceededError
-from .query import get_queries_instance_from_arguments, get_signed_query_arguments
+from .query import (
+    Query,
+    get_queries_instance_from_arguments,
+    get_signed_query_arguments,
+)
 from .systems import System, SystemPipeline
-from .threading import ECS_EXECUTOR_QUEUE
+from .threading import get_ecs_thread_pool
 from .utils import Signature
 
 logger = logging.getLogger(__name__)
@@ -20,14 +30,27 @@ logger = logging.getLogger(__name__)
 class Registry:
     number_of_entities: int = 0
     component_pools: List[Optional[IComponentPool]] = field(default_factory=list)
-    systems: Dict[SystemPipeline, Set[System]] = field(
-        default_factory=lambda: {key: set() for key in SystemPipeline}
+    # systems run in the order they were added to their pipeline
+    systems: Dict[SystemPipeline, List[System]] = field(
+        default_factory=lambda: {key: [] for key in SystemPipeline}
     )
     queries: dict[System, Sequence[object]] = field(default_factory=dict)
+    # per pipeline (system, arguments) pairs, rebuilt when systems change
+    system_calls: Dict[
+        SystemPipeline, Tuple[Tuple[System, Tuple[object, ...]], ...]
+    ] = field(default_factory=dict)
     entity_component_signatures: List[Signature] = field(default_factory=list)
+    # entities with the same signature (archetype) always match the same queries
+    archetype_queries: Dict[int, List[Query]] = field(default_factory=dict)
 
     entities_to_be_added: Set[Entity] = field(default_factory=set)
+    # live entities whose signature changed since the last update
+    entities_to_be_updated: Set[Entity] = field(default_factory=set)
     entities_to_be_removed: Set[Entity] = field(default_factory=set)
+    # removed components stay readable until the entity leaves its queries
+    components_to_be_removed: Set[Tuple[Entity, Type[Component]]] = field(
+        default_factory=set
+    )
     free_entity_ids: deque[int] = field(default_factory=deque)
 
     # resources
@@ -41,12 +64,35 @@ class Registry:
             if entity_id >= len(self.entity_component_signatures):
                 self.entity_component_signatures.extend([Signature(MAX_COMPONENTS)])
         else:
-            entity_id = self.free_entity_ids.popleft()
+            # reuse the most recently freed id, its pool slots are still warm
+            entity_id = self.free_entity_ids.pop()
 
         entity = Entity(entity_id, self)
         self.entities_to_be_added.add(entity)
         return entity
 
+    def create_entities(self, count: int) -> List[Entity]:
+        """Create `count` entities at once, reusing freed ids first.
+
+        The signature storage is grown in a single step instead of once per entity.
+        """
+        reused = min(count, len(self.free_entity_ids))
+        entity_ids = [self.free_entity_ids.pop() for _ in range(reused)]
+
+        first_new_id = self.number_of_entities + 1
+        self.number_of_entities += count - reused
+        entity_ids.extend(range(first_new_id, self.number_of_entities + 1))
+
+        missing = self.number_of_entities - len(self.entity_component_signatures)
+        if missing > 0:
+            self.entity_component_signatures.extend(
+                [Signature(MAX_COMPONENTS) for _ in range(missing)]
+            )
+
+        entities = [Entity(entity_id, self) for entity_id in entity_ids]
+        self.entities_to_be_added.update(entities)
+        return entities
+
     # Component management
     def add_component(
         self,
@@ -54,10 +100,43 @@ class Registry:
         component_type: Type[TComponent],
         component: TComponent,
     ) -> None:
-        logger.debug(f"Adding component {component_type.__name__} to entity {entity}.")
+        # lazy %-formatting: the message is only built when DEBUG is enabled
+        logger.debug(
+            "Adding component %s to entity %s.", component_type.__name__, entity
+        )
         entity_id = entity.get_id()
+        component_id = self._store_component(entity_id, component_type, component)
 
-        component_id = ComponentIndex.get_id(component_type.__name__)
+        self.entity_component_signatures[entity_id - 1].set(component_id, True)
+        self._mark_signature_changed(entity)
+
+    def add_components(
+        self,
+        entity: Entity,
+        components: Dict[Type[Component], Component],
+    ) -> None:
+        """Add several components to an entity with a single signature update."""
+        logger.debug("Adding %d components to entity %s.", len(components), entity)
+        entity_id = entity.get_id()
+
+        components_mask = 0
+        for component_type, component in components.items():
+            components_mask |= 1 << self._store_component(
+                entity_id, component_type, component
+            )
+
+        signature = self.entity_component_signatures[entity_id - 1]
+        signature.set_bits(signature.get_bits() | components_mask)
+        self._mark_signature_changed(entity)
+
+    def _store_component(
+        self,
+        entity_id: int,
+        component_type: Type[TComponent],
+        component: TComponent,
+    ) -> int:
+        """Put the component in its pool and return the component id."""
+        component_id = ComponentIndex.get_id(component_type)
 
         if component_id >= len(self.component_pools):
             if component_id >= MAX_COMPONENTS:
@@ -76,26 +155,31 @@ class Registry:
             component_pool.extend([None] * (entity_id - len(component_pool) + 1))
         # Set the component to the pool
         component_pool.set(entity_id - 1, component)
-
-        self.entity_component_signatures[entity_id - 1].set(component_id, True)
+        return component_id
 
     def get_component(
         self,
         entity: Entity,
         component_type: Type[TComponent],
     ) -> Optional[TComponent]:
-        entity_id: int = entity.get_id()
-        component_id: int = ComponentIndex.get_id(component_type.__name__)
-        if (
-            component_id > len(self.component_pools)
-            or self.component_pools[component_id - 1] is None
-        ):
+        component_pool = self.get_component_pool(component_type)
+        if component_pool is None:
             return None
 
-        component_pool: ComponentPool[TComponent] = cast(
-            ComponentPool[TComponent], self.component_pools[component_id - 1]
+        return component_pool.get(entity.get_id() - 1)
+
+    def get_component_pool(
+        self,
+        component_type: Type[TComponent],
+    ) -> Optional[ComponentPool[TComponent]]:
+        component_id: int = ComponentIndex.get_id(component_type)
+        if component_id > len(self.component_pools):
+            return None
+
+        return cast(
+            Optional[ComponentPool[TComponent]],
+            self.component_pools[component_id - 1],
         )
-        return component_pool.get(entity_id - 1)
 
     def remove_component(
         self,
@@ -103,8 +187,15 @@ class Registry:
         component_type: Type[TComponent],
     ) -> None:
         entity_id: int = entity.get_id()
-        component_id: int = ComponentIndex.get_id(component_type.__name__)
+        component_id: int = ComponentIndex.get_id(component_type)
         self.entity_component_signatures[entity_id - 1].clear_bit(component_id)
+        self._mark_signature_changed(entity)
+        self.components_to_be_removed.add((entity, component_type))
+
+    def _mark_signature_changed(self, entity: Entity) -> None:
+        # new entities are matched from scratch when they are added to systems
+        if entity not in self.entities_to_be_added:
+            self.entities_to_be_updated.add(entity)
 
     def has_component(
         self,
@@ -112,29 +203,43 @@ class Registry:
         component_type: Type[TComponent],
     ) -> bool:
         entity_id: int = entity.get_id()
-        component_id: int = ComponentIndex.get_id(component_type.__name__)
+        component_id: int = ComponentIndex.get_id(component_type)
 
         return self.entity_component_signatures[entity_id - 1].test(component_id)
 
     # System management
     def add_system(self, pipeline: SystemPipeline, system: System) -> None:
+        # ASYNC_UPDATE systems run on the ECS thread pool, which would only create
+        # the coroutine of an `async def` system and never await it
+        if pipeline == SystemPipeline.ASYNC_UPDATE and iscoroutinefunction(system):
+            raise ValueError(
+                "ASYNC_UPDATE systems run on worker threads and must be regular "
+                f"functions, {system.__name__} is a coroutine function"
+            )
 
         arguments = get_signed_query_arguments(system)
         self._fill_arguments_with_resources(arguments)
         self.queries[system] = list(arguments.values())
+        for query in get_queries_instance_from_arguments(self.queries[system]):
+            query._registry = self
+        self.archetype_queries.clear()
 
         if self.systems.get(pipeline) is None:
-            self.systems[pipeline] = set()
+            self.systems[pipeline] = []
         if not isfunction(system):
             raise ValueError("System must be a function")
-        self.systems[pipeline].add(system)
+        if system not in self.systems[pipeline]:
+            self.systems[pipeline].append(system)
+        # the system may already be in other pipelines with its previous queries
+        for bound_pipeline in self.systems:
+            self._bind_system_calls(bound_pipeline)
 
     def _fill_arguments_with_resources(self, arguments: dict) -> None:
-        for key, value in arguments.copy().items():
-            for resource_name, _ in self.resources.items():
-                if isclass(value) and resource_name == value.__name__:
-                    resource_value = self.resources[resource_name]
-                    arguments[key] = resource_value
+        resources = self.resources
+        for key, value in arguments.items():
+            # resources are keyed by class name, one lookup per annotated class
+            if isclass(value) and value.__name__ in resources:
+                arguments[key] = resources[value.__name__]
 
     def add_entity_to_systems(self, entity: Entity) -> None:
         entity_id: int = entity.get_id()
@@ -142,11 +247,33 @@ class Registry:
             entity_id - 1
         ]
 
+        archetype = entity_component_signature.get_bits()
+        matching_queries = self.archetype_queries.get(archetype)
+        if matching_queries is None:
+            matching_queries = self._get_matching_queries(entity_component_signature)
+            self.archetype_queries[archetype] = matching_queries
+
+        for query in matching_queries:
+            query.add_entity(entity)
+
+    def _get_matching_queries(self, signature: Signature) -> List[Query]:
+        matching_queries = []
         for arguments in self.queries.values():
-            queries = get_queries_instance_from_arguments(arguments)
-            for query in queries:
-                if query.get_component_signature().matches(entity_component_signature):
-                    query.add_entity(entity)
+            for query in get_queries_instance_from_arguments(arguments):
+                if query.matches(signature):
+                    matching_queries.append(query)
+        return matching_queries
+
+    def update_entity_in_systems(
+        self, entity: Entity, queries: Sequence[Query]
+    ) -> None:
+        """Re-match an entity whose signature changed against the given queries."""
+        signature = self.entity_component_signatures[entity.get_id() - 1]
+        for query in queries:
+            if query.matches(signature):
+                query.add_entity(entity)
+            else:
+                query.remove_entity(entity)
 
     def remove_entity_from_systems(self, entity: Entity) -> None:
         for arguments in self.queries.values():
@@ -159,9 +286,16 @@ class Registry:
 
     def remove_system(self, pipeline: SystemPipeline, system: System) -> None:
         self.systems[pipeline].remove(system)
+        self._bind_system_calls(pipeline)
+
+    def _bind_system_calls(self, pipeline: SystemPipeline) -> None:
+        """Resolve the arguments of every system once, so `run` does no lookups."""
+        self.system_calls[pipeline] = tuple(
+            (system, tuple(self.queries[system])) for system in self.systems[pipeline]
+        )
 
     def has_system(self, system: System) -> bool:
-        return system in self.systems
+        return any(system in systems for systems in self.systems.values())
 
     # Update
     def update(self) -> None:
@@ -171,17 +305,61 @@ class Registry:
                 self.add_entity_to_systems(entity)
             self.entities_to_be_added.clear()
 
+        if len(self.entities_to_be_updated) > 0:
+            queries = [
+                query
+                for arguments in self.queries.values()
+                for query in get_queries_instance_from_arguments(arguments)
+            ]
+            for entity in self.entities_to_be_updated:
+                self.update_entity_in_systems(entity, queries)
+            self.entities_to_be_updated.clear()
+
+        if len(self.components_to_be_removed) > 0:
+            for entity, component_type in self.components_to_be_removed:
+                self._release_component(entity, component_type)
+            self.components_to_be_removed.clear()
+
         if len(self.entities_to_be_removed) > 0:
             for entity in self.entities_to_be_removed:
                 self.remove_entity_from_systems(entity)
-                self.entity_component_signatures[entity.get_id() - 1].clear()
-                self.free_entity_ids.append(entity.get_id())
+                self._release_entity_id(entity.get_id())
             self.entities_to_be_removed.clear()
 
+    def _release_component(self, entity: Entity, component_type: Type[Component]):
+        """Clear a removed component's pool slot, unless it was added back since."""
+        entity_id = entity.get_id()
+        if self.has_component(entity, component_type):
+            return
+        component_pool = self.get_component_pool(component_type)
+        if component_pool is not None and entity_id <= len(component_pool):
+            component_pool.remove(entity_id - 1)
+
+    def _release_entity_id(self, entity_id: int) -> None:
+        """Clear the entity's slots so the id can be reused by `create_entity`."""
+        self.entity_component_signatures[entity_id - 1].clear()
+        for component_pool in self.component_pools:
+            if component_pool is not None and entity_id <= len(component_pool):
+                component_pool.remove(entity_id - 1)
+        self.free_entity_ids.append(entity_id)
+
     def run(self, pipeline: SystemPipeline) -> None:
-        for system in self.systems[pipeline]:
-            # Need to improve the threading system
-            # maybe spliting the queries in chunks of entities
-            # if pipeline == SystemPipeline.UPDATE:
-            #   ECS_EXECUTOR_QUEUE.put_nowait((system, self.queries[system]))
-            system(*self.queries[system])
+        for system, arguments in self.system_calls.get(pipeline, ()):
+            system(*arguments)
+
+    def run_concurrently(self, pipeline: SystemPipeline) -> None:
+        """Run the systems of a pipeline at the same time and wait for all of them.
+
+        Systems in the same pipeline must not write components that another
+        system of that pipeline reads or writes. The speedup comes from systems
+        that release the GIL while they work (I/O, native extensions).
+        """
+        system_calls = self.system_calls.get(pipeline)
+        if not system_calls:
+            return
+        thread_pool = get_ecs_thread_pool()
+        futures = [
+            thread_pool.submit(system, *arguments) for system, arguments in system_calls
+        ]
+        for future in futures:
+            future.result()
@@ -1,18 +1,12 @@
-import time
-from queue import Queue
-from threading import Event, Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-ECS_LOCK = Lock()
-ECS_KILL_THREAD_EVENT = Event()
-ECS_EXECUTOR_QUEUE = Queue()
-FIXED_FRAME_TIME = 1 / 60
+_ecs_thread_pool: Optional[ThreadPoolExecutor] = None
 
 
-def run_ecs_thread_executor():
-    while not ECS_KILL_THREAD_EVENT.is_set():
-        with ECS_LOCK:
-            while not ECS_EXECUTOR_QUEUE.empty():
-                system, args = ECS_EXECUTOR_QUEUE.get_nowait()
-                system(*args)
-                ECS_EXECUTOR_QUEUE.task_done()
-        time.sleep(FIXED_FRAME_TIME)
+def get_ecs_thread_pool() -> ThreadPoolExecutor:
+    """Return the long-lived thread pool used to run concurrent systems."""
+    global _ecs_thread_pool
+    if _ecs_thread_pool is None:
+        _ecs_thread_pool = ThreadPoolExecutor(thread_name_prefix="arepy-ecs")
+    return _ecs_thread_pool
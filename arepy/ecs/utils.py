@@ -36,39 +36,82 @@ logging.basicConfig(
     ],
 )
 
-from bitarray import bitarray
+
+from .constants import MAX_COMPONENTS
+
+# component ids index the bits, and the registry keeps them below MAX_COMPONENTS
+SIGNATURE_BITS = MAX_COMPONENTS
+
+# single-bit masks and their inverses, indexed by bit: no shift per bit operation
+_BITS = tuple(1 << index for index in range(SIGNATURE_BITS))
+_INV_BITS = tuple(~bit for bit in _BITS)
+
+
+def _check_index(index: int) -> None:
+    # a negative index would wrap around the tables and touch the wrong bit
+    if not 0 <= index < SIGNATURE_BITS:
+        raise IndexError(
+            f"Signature bit {index} is out of range (0 to {SIGNATURE_BITS - 1})."
+        )
 
 
 class Signature:
-    __slots__ = ["__bits", "__flipped"]
+    """Fixed-width component bitset backed by a single Python int."""
+
+    __slots__ = ["__bits", "__all_ones", "__flipped"]
 
     def __init__(self, size: int):
-        self.__bits = bitarray(size)
-        self.__bits.setall(False)
+        self.__bits = 0
+        # precomputed for flip: one XOR instead of rebuilding the mask per call
+        self.__all_ones = (1 << size) - 1
         self.__flipped = False
 
     def set(self, index, value: bool):
-        self.__bits[index] = value
+        # clear the bit, then OR the value back in: -True is all ones, -False is 0,
+        # so there is no branch on `value`
+        _check_index(index)
+        self.__bits = (self.__bits & _INV_BITS[index]) | (_BITS[index] & -bool(value))
 
     def flip(self):
         self.__flipped = not self.__flipped
-        self.__bits = ~self.__bits
+        self.__bits ^= self.__all_ones
 
     def clear_bit(self, index: int):
-        self.__bits[index] = False
+        _check_index(index)
+        self.__bits &= _INV_BITS[index]
 
     def test(self, index: int):
-        return self.__bits[index] == True
+        _check_index(index)
+        return self.__bits & _BITS[index] != 0
 
-    def get_bits(self):
+    def get_bits(self) -> int:
         return self.__bits
 
+    def set_bits(self, bits: int):
+        self.__bits = bits
+
     def matches(self, other_signature: "Signature"):
-        matches = (other_signature.get_bits() & self.get_bits()) == self.get_bits()
-        return matches
+        bits = self.__bits
+        return other_signature.__bits & bits == bits
+
+    def count(self) -> int:
+        """Number of set bits."""
+        return self.__bits.bit_count()
+
+    def overlap_count(self, other_signature: "Signature") -> int:
+        """Number of bits set in both signatures."""
+        return (self.__bits & other_signature.__bits).bit_count()
 
     def clear(self):
-        self.__bits.setall(False)
+        self.__bits = 0
+
+    def copy(self) -> "Signature":
+        # ints are immutable, so sharing the mask is a full copy
+        signature = Signature.__new__(Signature)
+        signature.__bits = self.__bits
+        signature.__all_ones = self.__all_ones
+        signature.__flipped = self.__flipped
+        return signature
 
     @property
     def was_flipped(self):
@@ -13,6 +13,8 @@ class Display(Protocol):
     def toggle_fullscreen(self) -> None: ...
     def hide_cursor(self) -> None: ...
     def show_cursor(self) -> None: ...
+    def disable_cursor(self) -> None: ...
+    def enable_cursor(self) -> None: ...
     def is_cursor_hidden(self) -> bool: ...
     def is_fullscreen(self) -> bool: ...
     def set_window_title(self, title: str) -> None: ...
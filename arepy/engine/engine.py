@@ -69,7 +69,6 @@ class ArepyEngine:
     def run(self):
 
         self.on_startup()
-        # _ = Thread(target=run_ecs_thread_executor, daemon=True).start()
         while not self.display.window_should_close():
             self.__input_process()
             self.__update_process()
@@ -78,7 +77,6 @@ class ArepyEngine:
 
     async def run_async(self):
         self.on_startup()
-        # await run_ecs_thread_executor()
         while not self.display.window_should_close():
             self.__input_process()
             self.__update_process()
@@ -95,6 +93,7 @@ class ArepyEngine:
     def __update_process(self):
         self._registry.update()
         self._registry.run(pipeline=SystemPipeline.UPDATE)
+        self._registry.run_concurrently(pipeline=SystemPipeline.ASYNC_UPDATE)
         self.on_update()
 
     def __render_process(self):
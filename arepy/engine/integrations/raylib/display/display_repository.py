@@ -91,6 +91,23 @@ def show_cursor() -> None:
     rl.ShowCursor()
 
 
+def disable_cursor() -> None:
+    """
+    Disable the cursor, locking it to the window.
+
+    While disabled, the mouse delta is reported as raw motion, so
+    camera controllers don't need to re-center the cursor every frame.
+    """
+    rl.DisableCursor()
+
+
+def enable_cursor() -> None:
+    """
+    Enable the cursor, releasing it from the window.
+    """
+    rl.EnableCursor()
+
+
 def is_cursor_hidden() -> bool:
     """
     Check if the cursor is hidden.
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
 from typing import cast
 
@@ -5,6 +6,12 @@ import raylib as rl
 
 from arepy.engine.renderer import ArepyTexture, Color, Rect, TextureFilter
 
+TEXTURE_FILTER_MAP = {
+    TextureFilter.NEAREST: rl.TEXTURE_FILTER_POINT,
+    TextureFilter.BILINEAR: rl.TEXTURE_FILTER_BILINEAR,
+    TextureFilter.TRILINEAR: rl.TEXTURE_FILTER_TRILINEAR,
+}
+
 
 def create_render_texture(width: int, height: int) -> ArepyTexture:
     """
@@ -36,6 +43,58 @@ def create_texture(path: PathLike[str]) -> ArepyTexture:
         ArepyTexture: The created texture.
     """
     texture = rl.LoadTexture(str(path).encode("utf-8"))
+    return _wrap_texture(texture)
+
+
+def create_textures(paths: list[PathLike[str]]) -> list[ArepyTexture]:
+    """
+    Create textures from several file paths.
+
+    The images are decoded on worker threads (raylib releases the GIL while
+    decoding), only the GPU upload runs on the calling thread.
+
+    Args:
+        paths (list[PathLike[str]]): The paths to the texture files.
+
+    Returns:
+        list[ArepyTexture]: The created textures, in the same order as `paths`.
+    """
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(_load_image, path) for path in paths]
+    # leaving the executor waited for every decode, so no result is still pending
+    images = []
+    error = None
+    for future in futures:
+        if future.exception() is None:
+            images.append(future.result())
+        elif error is None:
+            error = future.exception()
+    if error is not None:
+        # a decode failed: free the images the other workers already decoded
+        for image in images:
+            rl.UnloadImage(image)
+        raise error
+
+    textures = []
+    unloaded = 0
+    try:
+        for image in images:
+            texture = rl.LoadTextureFromImage(image)
+            rl.UnloadImage(image)
+            unloaded += 1
+            textures.append(_wrap_texture(texture))
+    finally:
+        # an upload failed: free the decoded images that never reached the GPU
+        for image in images[unloaded:]:
+            rl.UnloadImage(image)
+    return textures
+
+
+def _load_image(path: PathLike[str]):
+    return rl.LoadImage(str(path).encode("utf-8"))
+
+
+def _wrap_texture(texture) -> ArepyTexture:
     arepy_texture = ArepyTexture(texture.id, (texture.width, texture.height))
     arepy_texture._ref_texture = texture
     set_texture_filter(arepy_texture, arepy_texture._filter)
@@ -166,6 +225,20 @@ def draw_unfilled_rectangle(rect: Rect, color: Color) -> None:
     )
 
 
+def draw_circle(center: tuple[float, float], radius: float, color: Color) -> None:
+    """
+    Draw a filled circle.
+
+    Args:
+        center (tuple[float, float]): The center of the circle.
+        radius (float): The radius of the circle.
+        color (Color): The color of the circle.
+    """
+    # raylib triangulates the circle on the C side straight into the active
+    # render batch, so there is no per-vertex work left in Python.
+    rl.DrawCircleV(center, radius, (color.r, color.g, color.b, color.a))
+
+
 def draw_text(
     text: str, position: tuple[float, float], font_size: int, color: Color
 ) -> None:
@@ -260,9 +333,10 @@ def set_texture_filter(texture: ArepyTexture, filter: TextureFilter):
     Args:
         filter (TextureFilter): The texture filter to set.
     """
-    texture_filter_map = {
-        TextureFilter.NEAREST: rl.TEXTURE_FILTER_POINT,
-        TextureFilter.BILINEAR: rl.TEXTURE_FILTER_BILINEAR,
-        TextureFilter.TRILINEAR: rl.TEXTURE_FILTER_TRILINEAR,
-    }
-    rl.SetTextureFilter(texture._ref_texture, texture_filter_map[filter])  # type: ignore
+    # SetTextureFilter binds the texture and updates its parameters on the GPU,
+    # so skip the round-trip when the filter is already applied.
+    if texture._applied_filter is filter:
+        return
+    rl.SetTextureFilter(texture._ref_texture, TEXTURE_FILTER_MAP[filter])  # type: ignore
+    texture._filter = filter
+    texture._applied_filter = filter
@@ -21,6 +21,8 @@ class ArepyTexture:
         self._ref_texture: object = None
         self._ref_render_texture: object = None
         self._filter = filter
+        # filter currently set on the GPU texture, used to skip redundant updates
+        self._applied_filter: Optional[TextureFilter] = None
 
     def get_size(self) -> tuple[int, int]:
         return self._texture_size
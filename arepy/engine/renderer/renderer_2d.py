@@ -9,6 +9,7 @@ class Renderer2D(Protocol):
     # Texture methods
     def create_render_texture(self, width: int, height: int) -> ArepyTexture: ...
     def create_texture(self, path: PathLike[str]) -> ArepyTexture: ...
+    def create_textures(self, paths: list[PathLike[str]]) -> list[ArepyTexture]: ...
     def unload_texture(self, texture: ArepyTexture) -> None: ...
 
     # Draw methods
@@ -0,0 +1,55 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from arepy.asset_store import AssetStore
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.loaded_paths = []
+
+    def create_textures(self, paths):
+        self.loaded_paths.extend(paths)
+        return [f"texture:{path.name}" for path in paths]
+
+
+class AssetStoreTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.renderer = FakeRenderer()
+        self.asset_store = AssetStore()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _create_file(self, name: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb"):
+            pass
+        return path
+
+    def test_load_textures(self):
+        paths = {
+            "player": self._create_file("player.png"),
+            "enemy": self._create_file("enemy.png"),
+        }
+        self.asset_store.load_textures(self.renderer, paths)  # type: ignore
+
+        self.assertEqual(
+            [str(path) for path in self.renderer.loaded_paths], list(paths.values())
+        )
+        self.assertEqual(self.asset_store.get_texture("player"), "texture:player.png")
+        self.assertEqual(self.asset_store.get_texture("enemy"), "texture:enemy.png")
+
+    def test_load_textures_missing_file(self):
+        paths = {
+            "player": self._create_file("player.png"),
+            "enemy": os.path.join(self.directory.name, "missing.png"),
+        }
+        with self.assertRaises(FileNotFoundError):
+            self.asset_store.load_textures(self.renderer, paths)  # type: ignore
+
+        # nothing is loaded when any of the files is missing
+        self.assertEqual(self.renderer.loaded_paths, [])
+        self.assertEqual(self.asset_store.textures, {})
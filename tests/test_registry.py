@@ -1,8 +1,16 @@
+import gc
 from unittest import TestCase
 from unittest.mock import patch
+from weakref import ref
 
-from arepy.ecs.components import Component
-from arepy.ecs.registry import Registry
+from arepy.builders import EntityBuilder
+from arepy.ecs.components import Component, ComponentIndex
+from arepy.ecs.constants import MAX_COMPONENTS
+from arepy.ecs.exceptions import ComponentNotFoundError
+from arepy.ecs.query import Query, With, Without, get_signed_query_arguments
+from arepy.ecs.registry import Entity, Registry
+from arepy.ecs.systems import SystemPipeline
+from arepy.ecs.utils import Signature
 
 
 class Position(Component):
@@ -23,6 +31,17 @@ class RegistryTest(TestCase):
         entity = self.registry.create_entity()
         self.assertEqual(entity.get_id(), 1)
 
+    def test_create_entities(self):
+        first = self.registry.create_entity()
+        first.kill()
+        self.registry.update()
+
+        entities = self.registry.create_entities(3)
+        self.assertEqual([entity.get_id() for entity in entities], [1, 2, 3])
+        self.assertEqual(self.registry.number_of_entities, 3)
+        self.assertEqual(len(self.registry.entity_component_signatures), 3)
+        self.assertEqual(len(self.registry.entities_to_be_added), 3)
+
     def test_add_and_remove_components(self):
         # Add and entity
         entity = self.registry.create_entity()
@@ -44,6 +63,32 @@ class RegistryTest(TestCase):
         # Ensure the component is removed
         self.assertFalse(self.registry.has_component(entity, Position))
         self.assertTrue(self.registry.has_component(entity, Velocity))
+        # the component stays readable until the next update
+        self.assertIsNotNone(self.registry.get_component(entity, Position))
+        self.registry.update()
+        self.assertIsNone(self.registry.get_component(entity, Position))
+
+    def test_add_components(self):
+        entity = self.registry.create_entity()
+        position, velocity = Position(), Velocity()
+        self.registry.add_components(entity, {Position: position, Velocity: velocity})
+
+        self.assertIs(self.registry.get_component(entity, Position), position)
+        self.assertIs(self.registry.get_component(entity, Velocity), velocity)
+        self.assertTrue(self.registry.has_component(entity, Position))
+        self.assertTrue(self.registry.has_component(entity, Velocity))
+
+    def test_entity_builder(self):
+        entity = self.registry.create_entity()
+        builder = EntityBuilder(entity=entity, registry=self.registry)
+        builder.with_component(Position())
+        with self.assertRaises(TypeError):
+            builder.with_component(Position())
+
+        self.assertIs(builder.build(), entity)
+        self.assertTrue(self.registry.has_component(entity, Position))
+        self.assertNotIn("Registry", repr(builder))
+        self.assertEqual(len({builder}), 1)
 
     def test_kill_entities(self):
         # Add and entity
@@ -65,5 +110,291 @@ class RegistryTest(TestCase):
         self.assertEqual(len(registry.entity_component_signatures), 1)
         self.assertEqual(len(registry.entities_to_be_removed), 0)
 
+        # The id is recycled without the components of the killed entity
+        recycled = registry.create_entity()
+        self.assertEqual(recycled.get_id(), entity.get_id())
+        self.assertIsNone(registry.get_component(recycled, Position))
+
+    def test_query_get_components(self):
+        registry = Registry()
+        positions = []
+
+        def movement_system(query: Query[Entity, With[Position, Velocity]]):
+            for position, velocity in query.get_components(Position, Velocity):
+                position.x += velocity.x
+                positions.append(position.x)
+
+        registry.add_system(SystemPipeline.UPDATE, movement_system)
+
+        entity = registry.create_entity()
+        position = Position()
+        velocity = Velocity()
+        position.x, velocity.x = 0, 1
+        registry.add_component(entity, Position, position)
+        registry.add_component(entity, Velocity, velocity)
+        registry.update()
+
+        registry.run(SystemPipeline.UPDATE)
+        self.assertEqual(positions, [1])
+
+    def test_archetype_queries_are_shared(self):
+        registry = Registry()
+
+        def movement_system(query: Query[Entity, With[Position, Velocity]]): ...
+
+        registry.add_system(SystemPipeline.UPDATE, movement_system)
+        for _ in range(3):
+            entity = registry.create_entity()
+            registry.add_component(entity, Position, Position())
+            registry.add_component(entity, Velocity, Velocity())
+        registry.update()
+
+        query = registry.queries[movement_system][0]
+        self.assertEqual(len(registry.archetype_queries), 1)
+        self.assertEqual(len(query.get_entities()), 3)
+
+    def test_remove_component_before_update(self):
+        registry = Registry()
+        seen = []
+
+        def movement_system(query: Query[Entity, With[Position, Velocity]]):
+            seen.extend(query.get_components(Position, Velocity))
+
+        registry.add_system(SystemPipeline.UPDATE, movement_system)
+        entity = registry.create_entity()
+        position, velocity = Position(), Velocity()
+        registry.add_component(entity, Position, position)
+        registry.add_component(entity, Velocity, velocity)
+        registry.update()
+
+        # systems that run before the next update still get the component
+        registry.remove_component(entity, Velocity)
+        registry.run(SystemPipeline.UPDATE)
+        self.assertEqual(seen, [(position, velocity)])
+
+        registry.update()
+        seen.clear()
+        registry.run(SystemPipeline.UPDATE)
+        self.assertEqual(seen, [])
+        self.assertIsNone(registry.get_component(entity, Velocity))
+
+    def test_remove_and_add_back_component_before_update(self):
+        entity = self.registry.create_entity()
+        self.registry.add_component(entity, Position, Position())
+        self.registry.update()
+
+        position = Position()
+        self.registry.remove_component(entity, Position)
+        self.registry.add_component(entity, Position, position)
+        self.registry.update()
+
+        self.assertIs(self.registry.get_component(entity, Position), position)
+
+    def test_update_rematches_changed_entities(self):
+        registry = Registry()
+
+        def movement_system(query: Query[Entity, With[Position, Velocity]]): ...
+
+        registry.add_system(SystemPipeline.UPDATE, movement_system)
+        entity = registry.create_entity()
+        registry.add_component(entity, Position, Position())
+        registry.update()
+        query = registry.queries[movement_system][0]
+        self.assertEqual(len(query.get_entities()), 0)
+
+        registry.add_component(entity, Velocity, Velocity())
+        self.assertEqual(len(registry.entities_to_be_updated), 1)
+        registry.update()
+        self.assertEqual(query.get_entities(), [entity])
+
+        registry.remove_component(entity, Velocity)
+        registry.update()
+        self.assertEqual(len(query.get_entities()), 0)
+        self.assertEqual(len(registry.entities_to_be_updated), 0)
+
+    def test_system_resources_are_bound_once(self):
+        registry = Registry()
+        received = []
+
+        class Clock:
+            delta_time = 0.5
+
+        registry.resources[Clock.__name__] = Clock()
+
+        def clock_system(clock: Clock, query: Query[Entity, With[Position]]):
+            received.append(clock)
+
+        registry.add_system(SystemPipeline.UPDATE, clock_system)
+        registry.run(SystemPipeline.UPDATE)
+
+        self.assertEqual(received, [registry.resources["Clock"]])
+
+    def test_without_query(self):
+        registry = Registry()
+
+        def idle_system(query: Query[Entity, Without[Velocity]]): ...
+
+        registry.add_system(SystemPipeline.UPDATE, idle_system)
+        idle = registry.create_entity()
+        registry.add_component(idle, Position, Position())
+        moving = registry.create_entity()
+        registry.add_component(moving, Position, Position())
+        registry.add_component(moving, Velocity, Velocity())
+        registry.update()
+
+        query = registry.queries[idle_system][0]
+        self.assertEqual(query.get_entities(), [idle])
+
+    def test_systems_run_in_registration_order(self):
+        registry = Registry()
+        calls = []
+
+        def make_system(index):
+            def system():
+                calls.append(index)
+
+            return system
+
+        systems = [make_system(index) for index in range(5)]
+        for system in systems:
+            registry.add_system(SystemPipeline.UPDATE, system)
+
+        registry.run(SystemPipeline.UPDATE)
+        self.assertEqual(calls, [0, 1, 2, 3, 4])
+        self.assertTrue(registry.has_system(systems[0]))
+
+    def test_run_concurrently(self):
+        registry = Registry()
+        calls = []
+
+        def first_system(query: Query[Entity, With[Position]]):
+            calls.append("first")
+
+        def second_system(query: Query[Entity, With[Velocity]]):
+            calls.append("second")
+
+        registry.add_system(SystemPipeline.ASYNC_UPDATE, first_system)
+        registry.add_system(SystemPipeline.ASYNC_UPDATE, second_system)
+        registry.run_concurrently(SystemPipeline.ASYNC_UPDATE)
+
+        self.assertCountEqual(calls, ["first", "second"])
+
+    def test_async_update_rejects_coroutine_systems(self):
+        registry = Registry()
+
+        async def coroutine_system(query: Query[Entity, With[Position]]): ...
+
+        with self.assertRaises(ValueError):
+            registry.add_system(SystemPipeline.ASYNC_UPDATE, coroutine_system)
+        self.assertNotIn(coroutine_system, registry.queries)
+        self.assertFalse(registry.has_system(coroutine_system))
+
+    def test_signed_query_arguments_are_fresh(self):
+        def movement_system(query: Query[Entity, With[Position, Velocity]]): ...
+
+        first = get_signed_query_arguments(movement_system)["query"]
+        second = get_signed_query_arguments(movement_system)["query"]
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            first.get_component_signature().get_bits(),
+            second.get_component_signature().get_bits(),
+        )
+
+    def test_query_specs_cache_does_not_keep_systems_alive(self):
+        def movement_system(query: Query[Entity, With[Position]]): ...
+
+        get_signed_query_arguments(movement_system)
+        system_ref = ref(movement_system)
+        del movement_system
+        gc.collect()
+
+        self.assertIsNone(system_ref())
+
+    def test_not_found_messages_do_not_keep_components_alive(self):
+        class Transient(Component):
+            x: int
+
+        error = ComponentNotFoundError(Transient)
+        self.assertEqual(str(error), f"Component {Transient} does not exist.")
+        component_ref = ref(Transient)
+        del Transient, error
+        gc.collect()
+
+        self.assertIsNone(component_ref())
+
+    def test_signed_query_arguments_with_string_annotations(self):
+        def movement_system(query: "Query[Entity, With[Position, Velocity]]"): ...
+
+        query = get_signed_query_arguments(movement_system)["query"]
+        self.assertIsInstance(query, Query)
+        self.assertTrue(
+            query.get_component_signature().test(ComponentIndex.get_id(Velocity))
+        )
+
+    def test_query_swap_remove(self):
+        query = Query()
+        entities = [Entity(entity_id, self.registry) for entity_id in (1, 2, 3)]
+        for entity in entities:
+            query.add_entity(entity)
+
+        query.remove_entity(entities[0])
+        self.assertEqual(query.get_entities(), [entities[2], entities[1]])
+
+        # removing an entity that is not in the query is a no-op
+        query.remove_entity(entities[0])
+        self.assertEqual(len(query.get_entities()), 2)
+
+        query.remove_entity(entities[1])
+        self.assertEqual(query.get_entities(), [entities[2]])
+
+    def test_component_id_by_class_and_name(self):
+        component_id = ComponentIndex.get_id(Position)
+        self.assertEqual(Position.__dict__["__arepy_component_id__"], component_id)
+        self.assertEqual(ComponentIndex.get_id("Position"), component_id)
+        self.assertEqual(Position().get_id(), component_id)
+
+        # `id` stays free for user fields
+        class NetId(Component):
+            def __init__(self, id: int):
+                self.id = id
+
+        net_id = NetId(5)
+        self.assertEqual(net_id.id, 5)
+        self.assertEqual(net_id.get_id(), ComponentIndex.get_id(NetId))
+
+    def test_signature_matches(self):
+        required = Signature(MAX_COMPONENTS)
+        required.set(3, True)
+        entity_signature = Signature(MAX_COMPONENTS)
+        entity_signature.set(1, True)
+        self.assertFalse(required.matches(entity_signature))
+
+        entity_signature.set(3, True)
+        self.assertTrue(required.matches(entity_signature))
+        self.assertTrue(entity_signature.test(3))
+
+        entity_signature.clear_bit(3)
+        self.assertFalse(entity_signature.test(3))
+        self.assertEqual(entity_signature.get_bits(), 0b10)
+
+        self.assertEqual(entity_signature.count(), 1)
+        self.assertEqual(required.overlap_count(entity_signature), 0)
+
+        copy = entity_signature.copy()
+        copy.set(2, True)
+        self.assertEqual(entity_signature.get_bits(), 0b10)
+        self.assertEqual(copy.get_bits(), 0b110)
+
+    def test_signature_rejects_out_of_range_bits(self):
+        signature = Signature(MAX_COMPONENTS)
+        for index in (-1, MAX_COMPONENTS):
+            with self.assertRaises(IndexError):
+                signature.set(index, True)
+            with self.assertRaises(IndexError):
+                signature.test(index)
+            with self.assertRaises(IndexError):
+                signature.clear_bit(index)
+        self.assertEqual(signature.get_bits(), 0)
+
 
 # to run: python -m unittest tests/test_registry.py
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from arepy.asset_store import AssetStore
+from arepy.bundle.components import Sprite, Transform
+from arepy.bundle.systems.render_system import render_system
+from arepy.ecs.registry import Registry
+from arepy.ecs.systems import SystemPipeline
+from arepy.math.vec2 import Vec2
+
+
+class FakeTexture:
+    def get_size(self):
+        return (16, 16)
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.drawn_x = []
+
+    def draw_texture(self, texture, src_rect, dst_rect, color):
+        self.drawn_x.append(dst_rect.x)
+
+    def start_frame(self): ...
+
+    def end_frame(self): ...
+
+    def draw_fps(self, position): ...
+
+
+class RenderSystemTest(TestCase):
+    def test_same_layer_sprites_draw_in_entity_order(self):
+        registry = Registry()
+        renderer = FakeRenderer()
+        asset_store = AssetStore(textures={"tile": FakeTexture()})  # type: ignore
+        registry.resources["Renderer2D"] = renderer
+        registry.resources["AssetStore"] = asset_store
+        registry.add_system(SystemPipeline.RENDER, render_system)
+
+        entities = []
+        for x in range(4):
+            entity = registry.create_entity()
+            registry.add_component(entity, Transform, Transform(Vec2(x, 0)))
+            registry.add_component(entity, Sprite, Sprite("tile", (0, 0, 16, 16), 0))
+            entities.append(entity)
+        registry.update()
+
+        # swap-remove moves the last entity into the freed slot of the query
+        registry.kill_entity(entities[1])
+        registry.update()
+        registry.run(SystemPipeline.RENDER)
+
+        self.assertEqual(renderer.drawn_x, [0, 2, 3])
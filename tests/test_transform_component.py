@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from arepy.bundle.components import RigidBody2D, Transform
+from arepy.bundle.systems.movement_system import movement_system
+from arepy.ecs.registry import Registry
+from arepy.ecs.systems import SystemPipeline
+from arepy.math.vec2 import Vec2
+
+
+class FakeRenderer:
+    def get_delta_time(self) -> float:
+        return 1.0
+
+
+class TransformComponentTest(TestCase):
+    def test_shared_vectors_move_independently(self):
+        registry = Registry()
+        registry.resources["Renderer2D"] = FakeRenderer()
+        registry.add_system(SystemPipeline.UPDATE, movement_system)
+
+        spawn = Vec2(10, 10)
+        speed = Vec2(1, 0)
+        entities = []
+        for _ in range(3):
+            entity = registry.create_entity()
+            registry.add_component(entity, Transform, Transform(spawn))
+            registry.add_component(entity, RigidBody2D, RigidBody2D(speed))
+            entities.append(entity)
+        registry.update()
+        registry.run(SystemPipeline.UPDATE)
+
+        for entity in entities:
+            position = entity.get_component(Transform).position
+            self.assertEqual(position, Vec2(11, 10))
+        self.assertEqual(spawn, Vec2(10, 10))
+        self.assertEqual(speed, Vec2(1, 0))